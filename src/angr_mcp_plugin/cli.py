@@ -5,12 +5,38 @@ from __future__ import annotations
 import argparse
 import json
 import time
-from dataclasses import asdict
-from pathlib import Path
+from typing import Any
 
-from .mcp_server import AngrEmbeddedMCPServer, ServerConfig
-from .session_state import ProgramDescriptor, SessionState
-from .sync_contract import SCHEMA_VERSION, SyncProgram, SyncSnapshot, from_json
+from .session_state import SessionState
+from .sync_contract import SCHEMA_VERSION, SyncProgram, SyncSnapshot, load_file
+
+
+class _DevArch:
+    name = "amd64"
+
+
+class _DevKb:
+    def __init__(self) -> None:
+        self.functions: dict[int, Any] = {}
+        self.strings: dict[int, Any] = {}
+
+
+class _DevObj:
+    entry = 0x401000
+    binary = "dev"
+
+
+class _DevLoader:
+    main_object = _DevObj()
+
+
+class _DevProject:
+    """Placeholder project bound by the dev server when no angr-management GUI is attached."""
+
+    filename = "dev-placeholder.bin"
+    loader = _DevLoader()
+    arch = _DevArch()
+    kb = _DevKb()
 
 
 def run_dev_server() -> None:
@@ -20,22 +46,11 @@ def run_dev_server() -> None:
     parser.add_argument("--port", type=int, default=8766)
     args = parser.parse_args()
 
+    from .mcp_server import AngrEmbeddedMCPServer, ServerConfig
+
     state = SessionState()
     # Bind placeholder descriptor for clean responses when not attached to GUI.
-    state.set_project(
-        type(
-            "_DevProject",
-            (),
-            {
-                "filename": "dev-placeholder.bin",
-                "loader": type(
-                    "_Loader", (), {"main_object": type("_Obj", (), {"entry": 0x401000, "binary": "dev"})()}
-                ),
-                "arch": type("_Arch", (), {"name": "amd64"})(),
-                "kb": type("_Kb", (), {"functions": {}, "strings": {}})(),
-            },
-        )()
-    )
+    state.set_project(_DevProject())
     server = AngrEmbeddedMCPServer(
         state,
         config=ServerConfig(transport=args.transport, host=args.host, port=args.port),
@@ -53,13 +68,13 @@ def validate_sync_contract_file() -> None:
     parser = argparse.ArgumentParser(description="Validate an angr MCP sync snapshot.")
     parser.add_argument("path", help="Path to snapshot JSON file")
     args = parser.parse_args()
-    parsed = from_json(Path(args.path).read_text(encoding="utf-8"))
+    parsed = load_file(args.path)
     print(
         json.dumps(
             {
                 "valid": True,
                 "schema_version": parsed.schema_version,
-                "program": asdict(parsed.program),
+                "program": parsed.program.to_dict(),
                 "counts": {
                     "functions": len(parsed.functions),
                     "strings": len(parsed.strings),
@@ -75,7 +90,7 @@ def validate_sync_contract_file() -> None:
 def _make_empty_snapshot() -> SyncSnapshot:
     return SyncSnapshot(
         schema_version=SCHEMA_VERSION,
-        program=SyncProgram(**asdict(ProgramDescriptor(name=None, path=None, architecture=None, entry=None))),
+        program=SyncProgram(name=None, path=None, architecture=None, entry=None),
         generated_at_unix=int(time.time()),
         functions=[],
         strings=[],
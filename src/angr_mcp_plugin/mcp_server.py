@@ -3,17 +3,23 @@
 from __future__ import annotations
 
 import logging
+import os
 import threading
 from dataclasses import dataclass
-from typing import Any, Literal
-
-from mcp.server.fastmcp import FastMCP
+from typing import TYPE_CHECKING, Any, Literal
 
 from .session_state import SessionState
-from .tools import register_automation_tools, register_core_tools, register_symbolic_tools
+
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
 
 logger = logging.getLogger(__name__)
 
+# FastMCP pulls in anyio/starlette/uvicorn; defer it until the server is actually
+# used unless the deployment asks to pre-warm at import time.
+if os.getenv("ANGR_MCP_EAGER") == "1":
+    import mcp.server.fastmcp  # noqa: F401
+
 
 @dataclass(frozen=True)
 class ServerConfig:
@@ -28,15 +34,26 @@ class AngrEmbeddedMCPServer:
     def __init__(self, session_state: SessionState, config: ServerConfig | None = None) -> None:
         self.session_state = session_state
         self.config = config or ServerConfig()
-        self.mcp = FastMCP("angr-mcp-plugin")
+        self._mcp: FastMCP | None = None
         self._thread: threading.Thread | None = None
         self._started = False
-        self._register_tools()
 
-    def _register_tools(self) -> None:
-        register_core_tools(self.mcp, self.session_state)
-        register_symbolic_tools(self.mcp, self.session_state)
-        register_automation_tools(self.mcp, self.session_state)
+    @property
+    def mcp(self) -> FastMCP:
+        """FastMCP instance, constructed and populated with tools on first access."""
+        if self._mcp is None:
+            from mcp.server.fastmcp import FastMCP
+
+            self._mcp = FastMCP("angr-mcp-plugin")
+            self._register_tools(self._mcp)
+        return self._mcp
+
+    def _register_tools(self, mcp: FastMCP) -> None:
+        from .tools import register_automation_tools, register_core_tools, register_symbolic_tools
+
+        register_core_tools(mcp, self.session_state)
+        register_symbolic_tools(mcp, self.session_state)
+        register_automation_tools(mcp, self.session_state)
 
     def start(self) -> dict[str, Any]:
         if self._started:
@@ -45,6 +62,17 @@ class AngrEmbeddedMCPServer:
         if self.config.transport == "stdio":
             raise ValueError("stdio transport cannot be embedded in angr-management plugin host")
 
+        # stop() is cooperative and leaves the transport thread serving; reuse it instead of
+        # re-initializing the transport and racing the old thread for the same port.
+        if self._thread is not None and self._thread.is_alive():
+            self._started = True
+            return {
+                "status": "resumed",
+                "transport": self.config.transport,
+                "host": self.config.host,
+                "port": self.config.port,
+            }
+
         # FastMCP 1.x configures network bind via settings, not run() kwargs.
         self.mcp.settings.host = self.config.host
         self.mcp.settings.port = self.config.port
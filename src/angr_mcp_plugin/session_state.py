@@ -7,7 +7,7 @@ from threading import RLock
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgramDescriptor:
     """Lightweight, JSON-serializable descriptor for the active program."""
 
@@ -16,6 +16,27 @@ class ProgramDescriptor:
     architecture: str | None
     entry: int | None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"name": self.name, "path": self.path, "architecture": self.architecture, "entry": self.entry}
+
+
+def describe_project(project: Any) -> ProgramDescriptor:
+    """Build a descriptor by walking project -> loader -> main_object / arch."""
+    filename = getattr(project, "filename", None)
+    loader = getattr(project, "loader", None)
+    main_object = getattr(loader, "main_object", None) if loader is not None else None
+    arch = getattr(project, "arch", None)
+    entry = getattr(main_object, "entry", None)
+    binary_name = getattr(main_object, "binary", None) or filename
+    arch_name = getattr(arch, "name", None)
+
+    return ProgramDescriptor(
+        name=str(binary_name) if binary_name is not None else None,
+        path=str(filename) if filename is not None else None,
+        architecture=str(arch_name) if arch_name is not None else None,
+        entry=int(entry) if isinstance(entry, int) else None,
+    )
+
 
 class SessionState:
     """Thread-safe adapter over angr-management runtime objects."""
@@ -24,10 +45,13 @@ class SessionState:
         self._lock = RLock()
         self._workspace: Any | None = None
         self._project: Any | None = None
+        self._descriptor_cache: tuple[int, ProgramDescriptor] | None = None
+        self._project_caches: dict[str, dict[Any, Any]] = {}
 
     def bind_workspace(self, workspace: Any) -> None:
         with self._lock:
             self._workspace = workspace
+            self._invalidate_caches()
             extracted = self._extract_project(workspace)
             if extracted is not None:
                 self._project = extracted
@@ -35,12 +59,33 @@ class SessionState:
     def set_project(self, project: Any) -> None:
         with self._lock:
             self._project = project
+            self._invalidate_caches()
+
+    def project_cache(self, name: str) -> dict[Any, Any]:
+        """
+        Return a named memo table scoped to the currently bound project.
+
+        Tables are dropped whenever the workspace or project is rebound, so tools can
+        memoize derived data without tracking project lifecycle themselves.
+        """
+        cache = self._project_caches.get(name)
+        if cache is None:
+            with self._lock:
+                cache = self._project_caches.setdefault(name, {})
+        return cache
+
+    def _invalidate_caches(self) -> None:
+        self._descriptor_cache = None
+        self._project_caches = {}
 
     def get_workspace(self) -> Any | None:
-        with self._lock:
-            return self._workspace
+        # Single reference reads are atomic; the lock only serializes writers.
+        return self._workspace
 
     def get_project(self) -> Any | None:
+        project = self._project
+        if project is not None or self._workspace is None:
+            return project
         with self._lock:
             if self._project is None and self._workspace is not None:
                 self._project = self._extract_project(self._workspace)
@@ -67,21 +112,25 @@ class SessionState:
         project = self.get_project()
         if project is None:
             return ProgramDescriptor(name=None, path=None, architecture=None, entry=None)
+        cached = self._descriptor_cache
+        if cached is not None and cached[0] == id(project):
+            return cached[1]
 
-        filename = getattr(project, "filename", None)
-        loader = getattr(project, "loader", None)
-        main_object = getattr(loader, "main_object", None) if loader is not None else None
-        arch = getattr(project, "arch", None)
-        entry = getattr(main_object, "entry", None)
-        binary_name = getattr(main_object, "binary", None) or filename
-        arch_name = getattr(arch, "name", None)
-
-        return ProgramDescriptor(
-            name=str(binary_name) if binary_name is not None else None,
-            path=str(filename) if filename is not None else None,
-            architecture=str(arch_name) if arch_name is not None else None,
-            entry=int(entry) if isinstance(entry, int) else None,
-        )
+        descriptor = describe_project(project)
+        self._descriptor_cache = (id(project), descriptor)
+        return descriptor
+
+    def resolve_program_descriptor(self, binary_path: str | None = None) -> ProgramDescriptor:
+        """
+        Descriptor for the project resolve_project(binary_path) would return.
+
+        The bound project's descriptor comes from the cache; an explicit binary path
+        always yields a freshly loaded project and is described directly.
+        """
+        project = self.resolve_project(binary_path=binary_path)
+        if binary_path:
+            return describe_project(project)
+        return self.get_program_descriptor()
 
     def _extract_project(self, workspace: Any) -> Any | None:
         candidates = (
@@ -3,22 +3,62 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+import re
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional decode accelerator, stdlib json fallback below
+    orjson = None  # type: ignore[assignment]
 
 SCHEMA_VERSION = "1.0"
 
+_IO_BUFFER_SIZE = 1 << 20
 
-@dataclass(frozen=True)
+_REQUIRED_KEYS = frozenset(
+    {
+        "schema_version",
+        "program",
+        "generated_at_unix",
+        "functions",
+        "strings",
+        "comments",
+        "metadata",
+    }
+)
+
+# Only a top-level *first* key is trusted: a later "schema_version" could belong to a nested object.
+# Sorted-key snapshots produced by to_json never match and always take the full parse path; the
+# check pays off for producers that lead with it, e.g. json.dumps(snapshot.to_dict()).
+_LEADING_SCHEMA_VERSION = re.compile(r'\s*\{\s*"schema_version"\s*:\s*"([^"\\]*)"')
+_LEADING_SCHEMA_VERSION_BYTES = re.compile(rb'\s*\{\s*"schema_version"\s*:\s*"([^"\\]*)"')
+_SCHEMA_PREFIX_SCAN_LIMIT = 2048
+
+# Checked in order; the first mismatch determines the reported error.
+_FIELD_TYPES: tuple[tuple[str, type, str], ...] = (
+    ("program", dict, "program must be an object"),
+    ("functions", list, "functions must be an array"),
+    ("strings", list, "strings must be an array"),
+    ("comments", list, "comments must be an array"),
+    ("metadata", dict, "metadata must be an object"),
+    ("generated_at_unix", int, "generated_at_unix must be an integer"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class SyncProgram:
     name: str | None
     path: str | None
     architecture: str | None
     entry: int | None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {"name": self.name, "path": self.path, "architecture": self.architecture, "entry": self.entry}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SyncSnapshot:
     schema_version: str
     program: SyncProgram
@@ -28,15 +68,71 @@ class SyncSnapshot:
     comments: list[dict[str, Any]]
     metadata: dict[str, Any]
 
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Shallow dict view for serialization.
+
+        Unlike dataclasses.asdict, row lists are shared rather than deep-copied.
+        """
+        return {
+            "schema_version": self.schema_version,
+            "program": self.program.to_dict(),
+            "generated_at_unix": self.generated_at_unix,
+            "functions": self.functions,
+            "strings": self.strings,
+            "comments": self.comments,
+            "metadata": self.metadata,
+        }
+
 
 def to_json(snapshot: SyncSnapshot) -> str:
     """Serialize snapshot to deterministic JSON."""
-    return json.dumps(asdict(snapshot), indent=2, sort_keys=True)
+    # Always stdlib: orjson leaves non-ASCII text unescaped and rejects integers beyond
+    # 64 bits, so its output would depend on whether the extra is installed.
+    return json.dumps(snapshot.to_dict(), indent=2, sort_keys=True)
 
 
-def from_json(payload: str) -> SyncSnapshot:
+def from_json(payload: str | bytes) -> SyncSnapshot:
     """Parse and validate a sync snapshot JSON payload."""
-    data = json.loads(payload)
+    _precheck_schema_version(payload)
+    return _snapshot_from_dict(_loads(payload))
+
+
+def _loads(payload: str | bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass  # e.g. integers beyond 64 bits; stdlib json accepts those or reports the error
+    return json.loads(payload)
+
+
+def _precheck_schema_version(payload: str | bytes) -> None:
+    """Reject a mismatched leading schema_version without parsing the whole payload."""
+    if isinstance(payload, str):
+        match = _LEADING_SCHEMA_VERSION.match(payload, 0, _SCHEMA_PREFIX_SCAN_LIMIT)
+        if match is not None:
+            _check_schema_version(match.group(1))
+    else:
+        match_bytes = _LEADING_SCHEMA_VERSION_BYTES.match(payload, 0, _SCHEMA_PREFIX_SCAN_LIMIT)
+        if match_bytes is not None:
+            _check_schema_version(match_bytes.group(1).decode("utf-8", errors="replace"))
+
+
+def _check_schema_version(value: Any) -> None:
+    if value != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported schema_version={value!r}; expected {SCHEMA_VERSION!r}")
+
+
+def from_stream(fp: IO[bytes] | IO[str]) -> SyncSnapshot:
+    """Parse and validate a sync snapshot from a readable file-like object."""
+    head = fp.read(_SCHEMA_PREFIX_SCAN_LIMIT)
+    _precheck_schema_version(head)
+    # Both reads come from the same stream, so they are both str or both bytes.
+    return _snapshot_from_dict(_loads(head + fp.read()))  # type: ignore[operator]
+
+
+def _snapshot_from_dict(data: dict[str, Any]) -> SyncSnapshot:
     validate_snapshot_dict(data)
     program = SyncProgram(**data["program"])
     return SyncSnapshot(
@@ -51,37 +147,55 @@ def from_json(payload: str) -> SyncSnapshot:
 
 
 def load_file(path: str | Path) -> SyncSnapshot:
-    return from_json(Path(path).read_text(encoding="utf-8"))
+    # Feed bytes straight to the decoder rather than materializing the file as str first.
+    with Path(path).open("rb", buffering=_IO_BUFFER_SIZE) as fp:
+        return from_stream(fp)
+
+
+def save_file_payload(path: str | Path, payload: str) -> None:
+    """Write an already-serialized snapshot payload without re-encoding it."""
+    with Path(path).open("w", encoding="utf-8", buffering=_IO_BUFFER_SIZE) as fp:
+        fp.write(payload)
 
 
 def save_file(path: str | Path, snapshot: SyncSnapshot) -> None:
-    Path(path).write_text(to_json(snapshot), encoding="utf-8")
+    with Path(path).open("wb", buffering=_IO_BUFFER_SIZE) as fp:
+        stream_snapshot(fp, snapshot)
+
+
+def stream_snapshot(fp: IO[bytes], snapshot: SyncSnapshot) -> None:
+    """
+    Write snapshot JSON to a binary stream one row at a time.
+
+    Output is byte-identical to to_json(), but only a single row is encoded in memory at once.
+    """
+    data = snapshot.to_dict()
+    for index, key in enumerate(sorted(data)):
+        fp.write(b"{\n  " if index == 0 else b",\n  ")
+        fp.write(_encode_chunk(key, 0))
+        fp.write(b": ")
+        value = data[key]
+        if isinstance(value, list) and value:
+            for row_index, row in enumerate(value):
+                fp.write(b"[\n    " if row_index == 0 else b",\n    ")
+                fp.write(_encode_chunk(row, 2))
+            fp.write(b"\n  ]")
+        else:
+            fp.write(_encode_chunk(value, 1))
+    fp.write(b"\n}")
+
+
+def _encode_chunk(value: Any, level: int) -> bytes:
+    encoded = json.dumps(value, indent=2, sort_keys=True).encode("utf-8")
+    # Structural newlines are the only raw newlines in JSON output, so re-indenting them is safe.
+    return encoded.replace(b"\n", b"\n" + b"  " * level) if level else encoded
 
 
 def validate_snapshot_dict(data: dict[str, Any]) -> None:
-    required_keys = {
-        "schema_version",
-        "program",
-        "generated_at_unix",
-        "functions",
-        "strings",
-        "comments",
-        "metadata",
-    }
-    missing = sorted(required_keys.difference(data.keys()))
-    if missing:
+    if not _REQUIRED_KEYS <= data.keys():
+        missing = sorted(_REQUIRED_KEYS.difference(data.keys()))
         raise ValueError(f"Missing sync snapshot keys: {missing}")
-    if data["schema_version"] != SCHEMA_VERSION:
-        raise ValueError(f"Unsupported schema_version={data['schema_version']!r}; expected {SCHEMA_VERSION!r}")
-    if not isinstance(data["program"], dict):
-        raise ValueError("program must be an object")
-    if not isinstance(data["functions"], list):
-        raise ValueError("functions must be an array")
-    if not isinstance(data["strings"], list):
-        raise ValueError("strings must be an array")
-    if not isinstance(data["comments"], list):
-        raise ValueError("comments must be an array")
-    if not isinstance(data["metadata"], dict):
-        raise ValueError("metadata must be an object")
-    if not isinstance(data["generated_at_unix"], int):
-        raise ValueError("generated_at_unix must be an integer")
+    _check_schema_version(data["schema_version"])
+    for key, expected_type, message in _FIELD_TYPES:
+        if not isinstance(data[key], expected_type):
+            raise ValueError(message)
@@ -2,28 +2,48 @@
 
 from __future__ import annotations
 
+import os
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from typing import Any
 
 from ..session_state import SessionState
-from ..sync_contract import SCHEMA_VERSION, SyncProgram, SyncSnapshot, from_json, save_file, to_json
+from ..sync_contract import (
+    SCHEMA_VERSION,
+    SyncProgram,
+    SyncSnapshot,
+    from_json,
+    load_file,
+    save_file,
+    save_file_payload,
+    to_json,
+)
+from .core import _lookup_function
+
+_READ_ONLY_BATCH_ACTIONS = frozenset({"sync_export", "current_program"})
+_MAX_BATCH_WORKERS = 8
 
 
 def _function_rows(project: Any) -> list[dict[str, Any]]:
     functions = getattr(getattr(project, "kb", None), "functions", None)
     if functions is None or not hasattr(functions, "items"):
         return []
-    rows: list[dict[str, Any]] = []
-    for addr, func in sorted(functions.items(), key=lambda item: int(item[0])):
-        rows.append(
-            {
-                "address": f"0x{addr:x}",
-                "name": getattr(func, "name", None),
-                "size": getattr(func, "size", None),
-            }
-        )
-    return rows
+    # KB function keys are already ints, so sort on them directly; itemgetter keeps the key call in C.
+    pairs = list(functions.items())
+    pairs.sort(key=itemgetter(0))
+    return [
+        {
+            "address": f"0x{addr:x}",
+            "name": getattr(func, "name", None),
+            "size": getattr(func, "size", None),
+        }
+        for addr, func in pairs
+    ]
+
+
+def _string_sort_key(item: tuple[Any, Any]) -> int:
+    return int(item[0]) if isinstance(item[0], int) else -1
 
 
 def _string_rows(project: Any) -> list[dict[str, Any]]:
@@ -32,7 +52,7 @@ def _string_rows(project: Any) -> list[dict[str, Any]]:
         return []
     items = list(strings.items()) if hasattr(strings, "items") else list(strings)
     if items and isinstance(items[0], tuple):
-        items = sorted(items, key=lambda item: int(item[0]) if isinstance(item[0], int) else -1)
+        items.sort(key=_string_sort_key)
     out: list[dict[str, Any]] = []
     for item in items:
         if isinstance(item, tuple) and len(item) == 2:
@@ -44,13 +64,28 @@ def _string_rows(project: Any) -> list[dict[str, Any]]:
     return out
 
 
+def _addressed_rows(
+    entries: list[dict[str, Any]], value_key: str, require_value: bool = False
+) -> list[tuple[int, str, Any]]:
+    """Parse snapshot row addresses in one pass, dropping rows that cannot be applied."""
+    rows: list[tuple[int, str, Any]] = []
+    for entry in entries:
+        addr_text = entry.get("address")
+        value = entry.get(value_key)
+        if not addr_text or not isinstance(addr_text, str) or (require_value and not value):
+            continue
+        try:
+            rows.append((int(addr_text, 16), addr_text, value))
+        except ValueError:
+            continue
+    return rows
+
+
 def register_automation_tools(mcp: Any, session_state: SessionState) -> None:
-    @mcp.tool()
-    def am_sync_export(output_path: str | None = None) -> dict[str, Any]:
-        """Export deterministic snapshot of active analysis state."""
+    def _build_snapshot() -> SyncSnapshot:
         project = session_state.require_project()
         descriptor = session_state.get_program_descriptor()
-        snapshot = SyncSnapshot(
+        return SyncSnapshot(
             schema_version=SCHEMA_VERSION,
             program=SyncProgram(
                 name=descriptor.name,
@@ -64,10 +99,26 @@ def register_automation_tools(mcp: Any, session_state: SessionState) -> None:
             comments=[],
             metadata={"tool": "angr_mcp", "mode": "plugin_bound"},
         )
-        payload = to_json(snapshot)
-        if output_path:
+
+    def _export_snapshot(snapshot: SyncSnapshot, output_path: str | None, include_payload: bool) -> dict[str, Any]:
+        if not output_path:
+            return {"snapshot": to_json(snapshot), "output_path": output_path}
+        if not include_payload:
             save_file(output_path, snapshot)
-        return {"snapshot": payload, "output_path": output_path}
+            return {"snapshot": None, "output_path": output_path, "bytes_written": os.path.getsize(output_path)}
+        payload = to_json(snapshot)
+        save_file_payload(output_path, payload)
+        return {"snapshot": payload, "output_path": output_path, "bytes_written": os.path.getsize(output_path)}
+
+    @mcp.tool()
+    def am_sync_export(output_path: str | None = None, include_payload: bool = True) -> dict[str, Any]:
+        """
+        Export deterministic snapshot of active analysis state.
+
+        When output_path is given and include_payload is false, the snapshot is only
+        written to disk and the inline payload is omitted from the response.
+        """
+        return _export_snapshot(_build_snapshot(), output_path, include_payload)
 
     @mcp.tool()
     def am_sync_import(
@@ -84,10 +135,9 @@ def register_automation_tools(mcp: Any, session_state: SessionState) -> None:
         if not snapshot_json and not snapshot_path:
             raise ValueError("Either snapshot_json or snapshot_path must be provided")
         if snapshot_path:
-            payload = Path(snapshot_path).read_text(encoding="utf-8")
+            parsed = load_file(snapshot_path)
         else:
-            payload = snapshot_json or ""
-        parsed = from_json(payload)
+            parsed = from_json(snapshot_json or "")
         applied = {"renamed_functions": 0, "applied_comments": 0}
         apply_errors: list[str] = []
         if apply_changes:
@@ -96,49 +146,32 @@ def register_automation_tools(mcp: Any, session_state: SessionState) -> None:
                 kb = getattr(project, "kb", None)
                 functions = getattr(kb, "functions", None)
                 comments = getattr(kb, "comments", None)
-                for entry in parsed.functions:
-                    addr_text = entry.get("address")
-                    new_name = entry.get("name")
-                    if not addr_text or not new_name or not isinstance(addr_text, str):
-                        continue
-                    try:
-                        addr = int(addr_text, 16)
-                    except ValueError:
-                        continue
-                    if functions is not None and addr in functions:
-                        func = functions[addr]
-                        if getattr(func, "name", None) != new_name:
-                            try:
-                                func.name = new_name
-                                applied["renamed_functions"] += 1
-                            except Exception as exc:  # noqa: BLE001
-                                apply_errors.append(f"rename {addr_text}: {exc}")
-                for entry in parsed.comments:
-                    addr_text = entry.get("address")
-                    text = entry.get("text")
-                    if comments is None or not addr_text or not isinstance(addr_text, str):
-                        continue
-                    try:
-                        addr = int(addr_text, 16)
-                    except ValueError:
+                function_rows = (
+                    _addressed_rows(parsed.functions, "name", require_value=True) if functions is not None else []
+                )
+                for addr, addr_text, new_name in function_rows:
+                    func = _lookup_function(functions, addr)
+                    if func is None or getattr(func, "name", None) == new_name:
                         continue
                     try:
-                        comments[addr] = text
-                        applied["applied_comments"] += 1
+                        func.name = new_name
+                        applied["renamed_functions"] += 1
                     except Exception as exc:  # noqa: BLE001
-                        apply_errors.append(f"comment {addr_text}: {exc}")
+                        apply_errors.append(f"rename {addr_text}: {exc}")
+                if comments is not None:
+                    for addr, addr_text, text in _addressed_rows(parsed.comments, "text"):
+                        try:
+                            comments[addr] = text
+                            applied["applied_comments"] += 1
+                        except Exception as exc:  # noqa: BLE001
+                            apply_errors.append(f"comment {addr_text}: {exc}")
                 session_state.refresh_gui()
             except Exception as exc:  # noqa: BLE001
                 apply_errors.append(str(exc))
 
         return {
             "schema_version": parsed.schema_version,
-            "program": {
-                "name": parsed.program.name,
-                "path": parsed.program.path,
-                "architecture": parsed.program.architecture,
-                "entry": parsed.program.entry,
-            },
+            "program": parsed.program.to_dict(),
             "counts": {
                 "functions": len(parsed.functions),
                 "strings": len(parsed.strings),
@@ -149,37 +182,71 @@ def register_automation_tools(mcp: Any, session_state: SessionState) -> None:
             "apply_errors": apply_errors,
         }
 
+    def _run_action(index: int, action: dict[str, Any], snapshot: SyncSnapshot | None = None) -> dict[str, Any]:
+        action_type = action.get("type")
+        try:
+            if action_type == "sync_export":
+                output_path = action.get("output_path")
+                result = _export_snapshot(
+                    snapshot if snapshot is not None else _build_snapshot(),
+                    output_path,
+                    bool(action.get("include_payload", not output_path)),
+                )
+            elif action_type == "sync_import":
+                result = am_sync_import(
+                    snapshot_json=action.get("snapshot_json"),
+                    snapshot_path=action.get("snapshot_path"),
+                    apply_changes=bool(action.get("apply_changes", True)),
+                )
+            elif action_type == "current_program":
+                result = session_state.get_program_descriptor().to_dict()
+            else:
+                raise ValueError(f"Unsupported batch action type: {action_type}")
+            return {"index": index, "ok": True, "type": action_type, "result": result}
+        except Exception as exc:  # noqa: BLE001 - structured batch continuation
+            return {"index": index, "ok": False, "type": action_type, "error": str(exc)}
+
     @mcp.tool()
     def am_run_batch(actions: list[dict[str, Any]]) -> dict[str, Any]:
-        """Run deterministic non-interactive operation batches."""
+        """
+        Run deterministic non-interactive operation batches.
+
+        Consecutive read-only actions run concurrently; any other action is a barrier
+        and runs alone, so mutations are observed in batch order.
+        """
         if not isinstance(actions, list):
             raise ValueError("actions must be a list")
 
         results: list[dict[str, Any]] = []
+        pending: list[tuple[int, dict[str, Any]]] = []
+
+        def _flush_pending() -> None:
+            # No mutation can happen inside a read-only run, so every export in it can share
+            # one snapshot. If building it fails, each action rebuilds and reports its own error.
+            snapshot: SyncSnapshot | None = None
+            if sum(1 for _, action in pending if action.get("type") == "sync_export") > 1:
+                try:
+                    snapshot = _build_snapshot()
+                except Exception:  # noqa: BLE001
+                    snapshot = None
+            # Only file writes gain from threads; everything else is cheaper to run inline.
+            writes = [item for item in pending if item[1].get("type") == "sync_export" and item[1].get("output_path")]
+            written: dict[int, dict[str, Any]] = {}
+            if len(writes) > 1:
+                with ThreadPoolExecutor(max_workers=min(_MAX_BATCH_WORKERS, len(writes))) as executor:
+                    outcomes = executor.map(lambda item: _run_action(item[0], item[1], snapshot), writes)
+                    written = dict(zip((index for index, _ in writes), outcomes, strict=True))
+            for index, action in pending:
+                results.append(written[index] if index in written else _run_action(index, action, snapshot))
+            pending.clear()
+
         for index, action in enumerate(actions):
-            action_type = action.get("type")
-            try:
-                if action_type == "sync_export":
-                    result = am_sync_export(output_path=action.get("output_path"))
-                elif action_type == "sync_import":
-                    result = am_sync_import(
-                        snapshot_json=action.get("snapshot_json"),
-                        snapshot_path=action.get("snapshot_path"),
-                        apply_changes=bool(action.get("apply_changes", True)),
-                    )
-                elif action_type == "current_program":
-                    descriptor = session_state.get_program_descriptor()
-                    result = {
-                        "name": descriptor.name,
-                        "path": descriptor.path,
-                        "architecture": descriptor.architecture,
-                        "entry": descriptor.entry,
-                    }
-                else:
-                    raise ValueError(f"Unsupported batch action type: {action_type}")
-                results.append({"index": index, "ok": True, "type": action_type, "result": result})
-            except Exception as exc:  # noqa: BLE001 - structured batch continuation
-                results.append({"index": index, "ok": False, "type": action_type, "error": str(exc)})
+            if action.get("type") in _READ_ONLY_BATCH_ACTIONS:
+                pending.append((index, action))
+                continue
+            _flush_pending()
+            results.append(_run_action(index, action))
+        _flush_pending()
 
         return {
             "results": results,
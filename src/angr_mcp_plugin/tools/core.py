@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
+from itertools import islice
 from typing import Any
 
 from ..session_state import SessionState
 
+_FUNCTION_ROW_FIELDS = ("address", "name", "size", "is_plt", "is_syscall")
 
-def _function_to_row(addr: int, func: Any) -> dict[str, Any]:
+
+def _hex_address(cache: dict[Any, Any], addr: int) -> str:
+    # Formatting is several times slower than a dict hit, and the same addresses recur across pages/xrefs.
+    text = cache.get(addr)
+    if text is None:
+        text = cache[addr] = f"0x{addr:x}"
+    return text
+
+
+def _function_to_row(address: str, func: Any) -> dict[str, Any]:
     return {
-        "address": f"0x{addr:x}",
+        "address": address,
         "name": getattr(func, "name", None),
         "size": getattr(func, "size", None),
         "is_plt": bool(getattr(func, "is_plt", False)),
@@ -17,6 +29,15 @@ def _function_to_row(addr: int, func: Any) -> dict[str, Any]:
     }
 
 
+def _lookup_function(functions: Any, addr: int) -> Any | None:
+    """Single-probe lookup; FunctionManager is a Mapping, so .get avoids a separate membership walk."""
+    if functions is None:
+        return None
+    if hasattr(functions, "get"):
+        return functions.get(addr)
+    return functions[addr] if addr in functions else None
+
+
 def register_core_tools(mcp: Any, session_state: SessionState) -> None:
     """Register the tool surface tied to active angr-management context."""
 
@@ -24,53 +45,45 @@ def register_core_tools(mcp: Any, session_state: SessionState) -> None:
     def am_get_current_program(binary_path: str | None = None) -> dict[str, Any]:
         """Return descriptor for the program currently active in angr-management."""
         if binary_path:
-            project = session_state.resolve_project(binary_path=binary_path)
-            filename = getattr(project, "filename", None)
-            loader = getattr(project, "loader", None)
-            main_object = getattr(loader, "main_object", None) if loader is not None else None
-            arch = getattr(project, "arch", None)
-            entry = getattr(main_object, "entry", None)
-            return {
-                "name": str(getattr(main_object, "binary", filename)) if main_object is not None else str(filename),
-                "path": str(filename) if filename is not None else None,
-                "architecture": str(getattr(arch, "name", None)) if arch is not None else None,
-                "entry": int(entry) if isinstance(entry, int) else None,
-            }
-        descriptor = session_state.get_program_descriptor()
-        return {
-            "name": descriptor.name,
-            "path": descriptor.path,
-            "architecture": descriptor.architecture,
-            "entry": descriptor.entry,
-        }
+            return session_state.resolve_program_descriptor(binary_path=binary_path).to_dict()
+        return session_state.get_program_descriptor().to_dict()
 
     @mcp.tool()
-    def am_list_functions(offset: int = 0, limit: int = 100) -> dict[str, Any]:
-        """List functions from active project's knowledge base."""
+    def am_list_functions(offset: int = 0, limit: int = 100, columnar: bool = False) -> dict[str, Any]:
+        """
+        List functions from active project's knowledge base.
+
+        With columnar=true the page is returned as parallel per-field arrays under
+        "columns" instead of a list of row objects, which avoids repeating keys per row.
+        """
         project = session_state.require_project()
         if limit < 0:
             raise ValueError("limit must be >= 0")
         if offset < 0:
             raise ValueError("offset must be >= 0")
         functions = getattr(getattr(project, "kb", None), "functions", None)
-        if functions is None:
-            return {"functions": [], "total": 0}
         items: list[dict[str, Any]] = []
-        all_pairs = list(functions.items()) if hasattr(functions, "items") else []
-        for addr, func in all_pairs[offset : offset + limit]:
-            items.append(_function_to_row(addr, func))
-        return {"functions": items, "total": len(all_pairs), "offset": offset, "limit": limit}
+        total = 0
+        if functions is not None and hasattr(functions, "items"):
+            # Walk only up to the requested page instead of materializing every KB function.
+            page = islice(functions.items(), offset, offset + limit) if limit else ()
+            hex_cache = session_state.project_cache("addr_hex")
+            items = [_function_to_row(_hex_address(hex_cache, addr), func) for addr, func in page]
+            total = len(functions)
+        if columnar:
+            columns = {field: [row[field] for row in items] for field in _FUNCTION_ROW_FIELDS}
+            return {"columns": columns, "total": total, "offset": offset, "limit": limit}
+        return {"functions": items, "total": total, "offset": offset, "limit": limit}
 
     @mcp.tool()
     def am_get_function(address: str) -> dict[str, Any]:
         """Get details for a function by address."""
         project = session_state.require_project()
         addr = int(address, 16)
-        functions = getattr(getattr(project, "kb", None), "functions", None)
-        if functions is None or addr not in functions:
+        func = _lookup_function(getattr(getattr(project, "kb", None), "functions", None), addr)
+        if func is None:
             return {"error": f"Function not found at {address}"}
-        func = functions[addr]
-        return _function_to_row(addr, func)
+        return _function_to_row(_hex_address(session_state.project_cache("addr_hex"), addr), func)
 
     @mcp.tool()
     def am_decompile_function(address: str) -> dict[str, Any]:
@@ -105,37 +118,62 @@ def register_core_tools(mcp: Any, session_state: SessionState) -> None:
         strings = getattr(kb, "strings", None)
         if strings is None:
             return {"strings": [], "total": 0}
+        hex_cache = session_state.project_cache("addr_hex")
         rows: list[dict[str, Any]] = []
-        iterable = list(strings.items()) if hasattr(strings, "items") else list(strings)
-        for entry in iterable[offset : offset + limit]:
+        if hasattr(strings, "items"):
+            entries: Collection[Any] = strings.items()
+        elif hasattr(strings, "__len__"):
+            entries = strings
+        else:
+            entries = list(strings)
+        total = len(entries)
+        for entry in islice(entries, offset, offset + limit) if limit else ():
             if isinstance(entry, tuple) and len(entry) == 2:
                 addr, value = entry
             else:
                 addr = getattr(entry, "addr", None)
                 value = getattr(entry, "string", None) or str(entry)
-            rows.append({"address": f"0x{int(addr):x}" if isinstance(addr, int) else None, "value": str(value)})
-        return {"strings": rows, "total": len(iterable), "offset": offset, "limit": limit}
+            rows.append(
+                {"address": _hex_address(hex_cache, int(addr)) if isinstance(addr, int) else None, "value": str(value)}
+            )
+        return {"strings": rows, "total": total, "offset": offset, "limit": limit}
 
     @mcp.tool()
-    def am_get_xrefs_to(address: str, offset: int = 0, limit: int = 100) -> dict[str, Any]:
-        """List xrefs-to for a target address when available in KB."""
+    def am_get_xrefs_to(address: str, offset: int = 0, limit: int = 100, include_total: bool = False) -> dict[str, Any]:
+        """
+        List xrefs-to for a target address when available in KB.
+
+        Only the requested page is materialized unless include_total=true, in which case
+        the full ref set is counted; otherwise total is null.
+        """
         project = session_state.require_project()
+        if limit < 0:
+            raise ValueError("limit must be >= 0")
+        if offset < 0:
+            raise ValueError("offset must be >= 0")
         addr = int(address, 16)
         xrefs = getattr(getattr(project, "kb", None), "xrefs", None)
         if xrefs is None or not hasattr(xrefs, "get_xrefs_by_dst"):
             return {"xrefs": [], "total": 0, "note": "xrefs API unavailable in current project context"}
-        refs = list(xrefs.get_xrefs_by_dst(addr))
-        rows = refs[offset : offset + limit]
+        total: int | None = None
+        if include_total:
+            # Counted per call: analyses add xrefs to the KB without any rebind to invalidate on.
+            refs = list(xrefs.get_xrefs_by_dst(addr))
+            total = len(refs)
+            rows = refs[offset : offset + limit]
+        else:
+            rows = list(islice(xrefs.get_xrefs_by_dst(addr), offset, offset + limit))
+        hex_cache = session_state.project_cache("addr_hex")
         return {
             "xrefs": [
                 {
-                    "src": f"0x{int(getattr(ref, 'ins_addr', 0)):x}",
-                    "dst": f"0x{int(getattr(ref, 'dst', addr)):x}",
+                    "src": _hex_address(hex_cache, int(getattr(ref, "ins_addr", 0))),
+                    "dst": _hex_address(hex_cache, int(getattr(ref, "dst", addr))),
                     "type": str(getattr(ref, "type", "")),
                 }
                 for ref in rows
             ],
-            "total": len(refs),
+            "total": total,
             "offset": offset,
             "limit": limit,
         }
@@ -147,10 +185,9 @@ def register_core_tools(mcp: Any, session_state: SessionState) -> None:
             raise ValueError("new_name must be a non-empty string")
         project = session_state.require_project()
         addr = int(address, 16)
-        functions = getattr(getattr(project, "kb", None), "functions", None)
-        if functions is None or addr not in functions:
+        func = _lookup_function(getattr(getattr(project, "kb", None), "functions", None), addr)
+        if func is None:
             return {"error": f"Function not found at {address}"}
-        func = functions[addr]
         old_name = getattr(func, "name", None)
         try:
             func.name = new_name
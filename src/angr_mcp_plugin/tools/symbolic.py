@@ -2,47 +2,124 @@
 
 from __future__ import annotations
 
-import signal
-from contextlib import contextmanager
-from typing import Any
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
 
 from ..session_state import SessionState
 
+_T = TypeVar("_T")
 
-@contextmanager
-def _timeout(seconds: int):
-    if seconds <= 0:
-        yield
-        return
+_CFG_WORKERS_LOCK = threading.Lock()
 
-    def _handler(signum, frame):  # type: ignore[no-untyped-def]
-        raise TimeoutError(f"Operation timed out after {seconds} seconds")
+_claripy: Any | None = None
 
-    previous = signal.signal(signal.SIGALRM, _handler)
-    signal.alarm(seconds)
-    try:
-        yield
-    finally:
-        signal.alarm(0)
-        signal.signal(signal.SIGALRM, previous)
+
+def _get_claripy() -> Any:
+    """Import claripy on first use only, keeping it optional until symbolic tools run."""
+    global _claripy
+    if _claripy is None:
+        import claripy
+
+        _claripy = claripy
+    return _claripy
+
+
+class _StillRunning(Exception):
+    """Raised by _AnalysisWorker.wait when fn has not returned within the wait."""
+
+
+class _AnalysisWorker(Generic[_T]):
+    """
+    Run fn on a daemon thread whose outcome later callers can wait on.
+
+    Unlike SIGALRM this works from MCP server worker threads. An analysis that overruns a
+    caller's timeout cannot be interrupted, so it keeps running and the next caller waits
+    on the same worker instead of starting a second analysis. on_done runs on the worker
+    thread once fn has returned or raised, before any waiter is released.
+    """
+
+    def __init__(self, fn: Callable[[], _T], on_done: Callable[[_AnalysisWorker[_T]], None] | None = None) -> None:
+        self._results: list[_T] = []
+        self._errors: list[BaseException] = []
+        self._on_done = on_done
+        self._thread = threading.Thread(target=self._run, args=(fn,), name="angr-mcp-analysis", daemon=True)
+        self._thread.start()
+
+    def _run(self, fn: Callable[[], _T]) -> None:
+        try:
+            self._results.append(fn())
+        except BaseException as exc:  # noqa: BLE001 - re-raised on the waiting thread
+            self._errors.append(exc)
+        if self._on_done is not None:
+            self._on_done(self)
+
+    def outcome(self) -> _T | None:
+        """Result once fn has returned, or None while it runs or after it raised."""
+        return self._results[0] if self._results else None
+
+    def wait(self, seconds: int) -> _T:
+        self._thread.join(seconds if seconds > 0 else None)
+        if self._thread.is_alive():
+            raise _StillRunning
+        if self._errors:
+            raise self._errors[0]
+        return self._results[0]
+
+
+# In-flight CFGFast runs keyed by the project itself rather than held in project_cache(),
+# which every rebind clears, so a GUI event mid-run cannot start a second CFGFast on the KB.
+_RUNNING_CFGS: weakref.WeakKeyDictionary[Any, _AnalysisWorker[Any]] = weakref.WeakKeyDictionary()
 
 
 def register_symbolic_tools(mcp: Any, session_state: SessionState) -> None:
     @mcp.tool()
     def am_angr_entry(binary_path: str | None = None) -> dict[str, Any]:
         """Return entry-point metadata for active project."""
-        project = session_state.resolve_project(binary_path=binary_path)
-        loader = getattr(project, "loader", None)
-        main_object = getattr(loader, "main_object", None) if loader is not None else None
-        entry = getattr(main_object, "entry", None)
-        return {"entry": f"0x{entry:x}" if isinstance(entry, int) else None}
+        entry = session_state.resolve_program_descriptor(binary_path=binary_path).entry
+        return {"entry": f"0x{entry:x}" if entry is not None else None}
+
+    def _finish_cfg(project: Any, worker: _AnalysisWorker[Any]) -> None:
+        with _CFG_WORKERS_LOCK:
+            if _RUNNING_CFGS.get(project) is worker:
+                del _RUNNING_CFGS[project]
+            cfg = worker.outcome()
+            if cfg is not None and session_state.get_project() is project:
+                session_state.project_cache("cfg")[id(project)] = cfg
+
+    def _bound_cfg(project: Any, timeout: int) -> Any:
+        # Only the bound project's CFG is memoized: CFGFast also populates its KB. A finished
+        # CFG lives in project_cache() and goes away on rebind; a running one is joined.
+        with _CFG_WORKERS_LOCK:
+            cfg = session_state.project_cache("cfg").get(id(project))
+            if cfg is not None:
+                return cfg
+            worker = _RUNNING_CFGS.get(project)
+            if worker is None:
+                worker = _RUNNING_CFGS[project] = _AnalysisWorker(
+                    lambda: project.analyses.CFGFast(normalize=True), on_done=lambda done: _finish_cfg(project, done)
+                )
+        try:
+            return worker.wait(timeout)
+        except _StillRunning:
+            raise TimeoutError(
+                f"CFGFast did not finish within {timeout} seconds; it is still running and a retry will wait for it"
+            ) from None
 
     @mcp.tool()
     def am_angr_cfg(timeout: int = 60, binary_path: str | None = None) -> dict[str, Any]:
         """Build a CFG via CFGFast and summarize size."""
         project = session_state.resolve_project(binary_path=binary_path)
-        with _timeout(timeout):
-            cfg = project.analyses.CFGFast(normalize=True)
+        if binary_path:
+            # A binary_path project is a throwaway load, so its CFG is neither shared nor kept.
+            try:
+                cfg = _AnalysisWorker(lambda: project.analyses.CFGFast(normalize=True)).wait(timeout)
+            except _StillRunning:
+                raise TimeoutError(f"Operation timed out after {timeout} seconds") from None
+        else:
+            cfg = _bound_cfg(project, timeout)
         graph = getattr(cfg, "graph", None)
         node_count = int(graph.number_of_nodes()) if graph is not None else 0
         edge_count = int(graph.number_of_edges()) if graph is not None else 0
@@ -58,7 +135,7 @@ def register_symbolic_tools(mcp: Any, session_state: SessionState) -> None:
     ) -> dict[str, Any]:
         """Use simulation manager to find path reaching target address."""
         project = session_state.resolve_project(binary_path=binary_path)
-        claripy = __import__("claripy")
+        claripy = _get_claripy()
 
         target = int(find_addr, 16)
         avoid = [int(a, 16) for a in (avoid_addrs or [])]
@@ -70,7 +147,13 @@ def register_symbolic_tools(mcp: Any, session_state: SessionState) -> None:
             state = project.factory.full_init_state()
 
         simgr = project.factory.simgr(state)
-        with _timeout(timeout):
+        if timeout > 0:
+            # Checked by the simulation manager between steps, so it is safe on any thread.
+            deadline = time.monotonic() + timeout
+            simgr.explore(find=target, avoid=avoid, until=lambda _simgr: time.monotonic() >= deadline)
+            if not simgr.found and time.monotonic() >= deadline:
+                raise TimeoutError(f"Operation timed out after {timeout} seconds")
+        else:
             simgr.explore(find=target, avoid=avoid)
 
         found = len(simgr.found) > 0
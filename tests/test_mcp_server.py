@@ -0,0 +1,30 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+from angr_mcp_plugin.mcp_server import AngrEmbeddedMCPServer
+from angr_mcp_plugin.session_state import SessionState
+
+
+def test_fastmcp_constructed_on_first_access():
+    with patch("mcp.server.fastmcp.FastMCP") as mock_fastmcp_cls:
+        mock_fastmcp_cls.return_value = MagicMock()
+        server = AngrEmbeddedMCPServer(SessionState())
+        mock_fastmcp_cls.assert_not_called()
+
+        assert server.mcp is server.mcp
+        mock_fastmcp_cls.assert_called_once_with("angr-mcp-plugin")
+
+
+def test_restart_reuses_live_server_thread():
+    release = threading.Event()
+    server = AngrEmbeddedMCPServer(SessionState())
+    server._mcp = MagicMock()
+    server._mcp.run.side_effect = lambda transport: release.wait(timeout=5)
+    try:
+        assert server.start()["status"] == "started"
+        server.stop()
+        assert server.start()["status"] == "resumed"
+        assert server.start()["status"] == "already_running"
+        server._mcp.run.assert_called_once_with(transport="streamable-http")
+    finally:
+        release.set()
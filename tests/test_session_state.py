@@ -43,3 +43,38 @@ def test_require_project_raises_when_unbound():
         assert "No active angr project" in str(exc)
     else:
         raise AssertionError("Expected RuntimeError when no project is bound")
+
+
+def test_descriptor_cached_until_project_rebound():
+    state = SessionState()
+    project = _Project()
+    state.set_project(project)
+    first = state.get_program_descriptor()
+    assert state.get_program_descriptor() is first
+
+    state.set_project(project)
+    assert state.get_program_descriptor() is not first
+    assert state.get_program_descriptor() == first
+
+
+def test_project_cache_dropped_on_rebind():
+    state = SessionState()
+    state.set_project(_Project())
+    state.project_cache("rows")["key"] = "value"
+    assert state.project_cache("rows") == {"key": "value"}
+
+    state.bind_workspace(_Workspace())
+    assert state.project_cache("rows") == {}
+
+
+def test_resolve_program_descriptor_for_binary_path(monkeypatch):
+    state = SessionState()
+    state.set_project(object())
+    monkeypatch.setattr(state, "resolve_project", lambda binary_path=None: _Project())
+    descriptor = state.resolve_program_descriptor(binary_path="/tmp/fake.bin")
+    assert descriptor.to_dict() == {
+        "name": "fake.bin",
+        "path": "/tmp/fake.bin",
+        "architecture": "AMD64",
+        "entry": 0x401000,
+    }
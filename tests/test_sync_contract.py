@@ -1,3 +1,4 @@
+import io
 import json
 
 import pytest
@@ -7,6 +8,10 @@ from angr_mcp_plugin.sync_contract import (
     SyncProgram,
     SyncSnapshot,
     from_json,
+    from_stream,
+    load_file,
+    save_file,
+    stream_snapshot,
     to_json,
     validate_snapshot_dict,
 )
@@ -29,6 +34,22 @@ def test_sync_roundtrip():
     assert decoded.functions[0]["name"] == "main"
 
 
+def test_sync_file_roundtrip(tmp_path):
+    snapshot = SyncSnapshot(
+        schema_version=SCHEMA_VERSION,
+        program=SyncProgram(name="a.out", path="/tmp/a.out", architecture="AMD64", entry=0x401000),
+        generated_at_unix=123456,
+        functions=[{"address": "0x401000", "name": "main"}],
+        strings=[],
+        comments=[{"address": "0x401000", "text": "entry"}],
+        metadata={},
+    )
+    path = tmp_path / "snapshot.json"
+    save_file(path, snapshot)
+    assert path.read_text(encoding="utf-8") == to_json(snapshot)
+    assert load_file(path) == snapshot
+
+
 def test_sync_validation_missing_keys():
     with pytest.raises(ValueError):
         validate_snapshot_dict({"schema_version": SCHEMA_VERSION})
@@ -46,3 +67,69 @@ def test_sync_validation_wrong_schema():
     }
     with pytest.raises(ValueError):
         from_json(json.dumps(payload))
+
+
+def test_leading_schema_version_mismatch_rejected_before_parse():
+    truncated = '{"schema_version": "0.9", "functions": ['
+    with pytest.raises(ValueError, match="Unsupported schema_version='0.9'"):
+        from_json(truncated)
+    with pytest.raises(ValueError, match="Unsupported schema_version='0.9'"):
+        from_json(truncated.encode("utf-8"))
+
+
+def test_leading_schema_version_mismatch_rejected_from_file(tmp_path):
+    path = tmp_path / "old.json"
+    path.write_text('{"schema_version": "0.9", "functions": [' + "{}, " * 10_000, encoding="utf-8")
+    with pytest.raises(ValueError, match="Unsupported schema_version='0.9'"):
+        load_file(path)
+    with pytest.raises(ValueError, match="Unsupported schema_version='0.9'"):
+        from_stream(io.StringIO(path.read_text(encoding="utf-8")))
+
+
+def test_nested_schema_version_does_not_trigger_precheck():
+    payload = {
+        "metadata": {"schema_version": "0.9"},
+        "schema_version": SCHEMA_VERSION,
+        "program": {"name": None, "path": None, "architecture": None, "entry": None},
+        "generated_at_unix": 0,
+        "functions": [],
+        "strings": [],
+        "comments": [],
+    }
+    assert from_json(json.dumps(payload)).metadata == {"schema_version": "0.9"}
+
+
+def test_stream_snapshot_matches_to_json():
+    snapshot = SyncSnapshot(
+        schema_version=SCHEMA_VERSION,
+        program=SyncProgram(name="a.out", path=None, architecture="AMD64", entry=None),
+        generated_at_unix=1,
+        functions=[{"address": "0x401000", "name": "main", "size": 3}, {"address": "0x401100", "name": "b\nc"}],
+        strings=[],
+        comments=[{"address": "0x401000", "text": "nested", "tags": {"b": [1, 2], "a": {}}}],
+        metadata={"tool": "angr_mcp", "nested": {"k": []}},
+    )
+    buffer = io.BytesIO()
+    stream_snapshot(buffer, snapshot)
+    assert buffer.getvalue().decode("utf-8") == to_json(snapshot)
+
+
+def test_encoding_matches_stdlib_for_non_ascii_and_big_ints(tmp_path):
+    snapshot = SyncSnapshot(
+        schema_version=SCHEMA_VERSION,
+        program=SyncProgram(name="münchen", path=None, architecture="AMD64", entry=None),
+        generated_at_unix=1,
+        functions=[{"address": "0x401000", "name": "fünc", "size": 2**65}],
+        strings=[],
+        comments=[],
+        metadata={},
+    )
+    encoded = to_json(snapshot)
+    assert encoded == json.dumps(snapshot.to_dict(), indent=2, sort_keys=True)
+    assert "\\u00fc" in encoded
+    assert from_json(encoded).functions[0]["size"] == 2**65
+
+    path = tmp_path / "snapshot.json"
+    save_file(path, snapshot)
+    assert path.read_text(encoding="utf-8") == encoded
+    assert load_file(path).functions[0]["size"] == 2**65
@@ -1,9 +1,12 @@
 import json
+import threading
 from collections.abc import Callable
 from typing import Any
 
+import pytest
+
 from angr_mcp_plugin.session_state import SessionState
-from angr_mcp_plugin.tools import register_automation_tools, register_core_tools, register_symbolic_tools
+from angr_mcp_plugin.tools import automation, register_automation_tools, register_core_tools, register_symbolic_tools
 
 
 class FakeMCP:
@@ -59,6 +62,14 @@ class FakeAnalyses:
         return FakeCfg()
 
 
+class FakeKB:
+    def __init__(self) -> None:
+        self.functions = {0x401000: FakeFunction("main", 32), 0x401100: FakeFunction("helper", 16)}
+        self.strings = {0x402000: "hello", 0x402100: "world"}
+        self.xrefs = FakeXRefs()
+        self.comments: dict[int, str] = {}
+
+
 class FakeProject:
     filename = "/tmp/fake.bin"
     arch = type("_Arch", (), {"name": "AMD64"})()
@@ -68,16 +79,10 @@ class FakeProject:
         {"main_object": type("_Obj", (), {"entry": 0x401000, "binary": "fake.bin"})()},
     )()
     analyses = FakeAnalyses()
-    kb = type(
-        "_KB",
-        (),
-        {
-            "functions": {0x401000: FakeFunction("main", 32), 0x401100: FakeFunction("helper", 16)},
-            "strings": {0x402000: "hello", 0x402100: "world"},
-            "xrefs": FakeXRefs(),
-            "comments": {},
-        },
-    )()
+
+    def __init__(self) -> None:
+        # Fresh KB per project so mutations in one test never leak into another.
+        self.kb = FakeKB()
 
 
 def _register_all_tools() -> tuple[FakeMCP, SessionState]:
@@ -95,7 +100,7 @@ def test_core_tools_work_with_active_project():
     program = mcp.tools["am_get_current_program"]()
     funcs = mcp.tools["am_list_functions"](offset=0, limit=10)
     fn = mcp.tools["am_get_function"]("0x401000")
-    xrefs = mcp.tools["am_get_xrefs_to"]("0x401000")
+    xrefs = mcp.tools["am_get_xrefs_to"]("0x401000", include_total=True)
     assert program["name"] == "fake.bin"
     assert funcs["total"] == 2
     assert fn["name"] == "main"
@@ -146,3 +151,273 @@ def test_sync_import_applies_changes():
     assert result["applied"]["applied_comments"] == 1
     assert project.kb.functions[0x401000].name == "main_after_import"
     assert project.kb.comments[0x401000] == "imported comment"
+
+
+def test_sync_import_looks_up_rows_without_walking_kb():
+    class NoWalkFunctions(dict):
+        def items(self):  # type: ignore[override]
+            raise AssertionError("import must not copy the whole function manager")
+
+    mcp, state = _register_all_tools()
+    snapshot = json.loads(mcp.tools["am_sync_export"]()["snapshot"])
+    kb = state.require_project().kb
+    kb.functions = NoWalkFunctions(kb.functions)
+    snapshot["functions"] = [{"address": "0x401100", "name": "helper_renamed"}, {"address": "0x409999", "name": "gone"}]
+    result = mcp.tools["am_sync_import"](snapshot_json=json.dumps(snapshot), apply_changes=True)
+    assert result["apply_errors"] == []
+    assert result["applied"]["renamed_functions"] == 1
+    assert kb.functions[0x401100].name == "helper_renamed"
+
+
+def test_batch_preserves_order_across_import_barrier():
+    mcp, _ = _register_all_tools()
+    snapshot = json.loads(mcp.tools["am_sync_export"]()["snapshot"])
+    snapshot["functions"] = [{"address": "0x401100", "name": "helper_renamed"}]
+    batch = mcp.tools["am_run_batch"](
+        [
+            {"type": "sync_export"},
+            {"type": "current_program"},
+            {"type": "sync_import", "snapshot_json": json.dumps(snapshot)},
+            {"type": "sync_export"},
+        ]
+    )
+    assert [row["index"] for row in batch["results"]] == [0, 1, 2, 3]
+    assert batch["failed"] == 0
+    before = json.loads(batch["results"][0]["result"]["snapshot"])
+    after = json.loads(batch["results"][3]["result"]["snapshot"])
+    assert before["functions"][1]["name"] == "helper"
+    assert after["functions"][1]["name"] == "helper_renamed"
+
+
+def test_sync_export_to_file_can_skip_payload(tmp_path):
+    mcp, _ = _register_all_tools()
+    path = tmp_path / "snapshot.json"
+    with_payload = mcp.tools["am_sync_export"](output_path=str(path))
+    assert with_payload["snapshot"] == path.read_text(encoding="utf-8")
+
+    batch = mcp.tools["am_run_batch"]([{"type": "sync_export", "output_path": str(path)}])
+    result = batch["results"][0]["result"]
+    assert result["snapshot"] is None
+    assert result["bytes_written"] == path.stat().st_size
+    assert json.loads(path.read_text(encoding="utf-8"))["schema_version"] == "1.0"
+
+
+def test_list_tools_paginate_without_changing_totals():
+    mcp, _ = _register_all_tools()
+    funcs = mcp.tools["am_list_functions"](offset=1, limit=1)
+    strings = mcp.tools["am_list_strings"](offset=0, limit=1)
+    empty = mcp.tools["am_list_functions"](offset=0, limit=0)
+    assert [row["address"] for row in funcs["functions"]] == ["0x401100"]
+    assert funcs["total"] == 2
+    assert strings["strings"] == [{"address": "0x402000", "value": "hello"}]
+    assert strings["total"] == 2
+    assert empty["functions"] == [] and empty["total"] == 2
+
+
+def test_function_rows_reflect_kb_changes():
+    mcp, state = _register_all_tools()
+    assert mcp.tools["am_get_function"]("0x401100")["name"] == "helper"
+    mcp.tools["am_rename_function"]("0x401100", "helper_v2")
+    assert mcp.tools["am_get_function"]("0x401100")["name"] == "helper_v2"
+    func = state.require_project().kb.functions[0x401100]
+    func.name = "renamed_in_gui"
+    func.size = 999
+    listed = mcp.tools["am_list_functions"](offset=1, limit=1)
+    assert listed["functions"][0]["name"] == "renamed_in_gui"
+    assert mcp.tools["am_get_function"]("0x401100")["size"] == 999
+
+
+class CountingAnalyses:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def CFGFast(self, normalize: bool = True) -> FakeCfg:  # noqa: N802
+        self.calls += 1
+        return FakeCfg()
+
+
+def test_symbolic_cfg_cached_for_bound_project_only(monkeypatch):
+    project = FakeProject()
+    project.analyses = CountingAnalyses()
+    standalone = FakeProject()
+    standalone.analyses = CountingAnalyses()
+    mcp, state = _register_all_tools()
+    state.set_project(project)
+    resolve = state.resolve_project
+    monkeypatch.setattr(state, "resolve_project", lambda binary_path=None: standalone if binary_path else resolve())
+
+    mcp.tools["am_angr_cfg"](timeout=1, binary_path=project.filename)
+    mcp.tools["am_angr_cfg"](timeout=1, binary_path=project.filename)
+    assert standalone.analyses.calls == 2
+    assert mcp.tools["am_angr_cfg"](timeout=1) == mcp.tools["am_angr_cfg"](timeout=1)
+    assert project.analyses.calls == 1
+    state.set_project(project)
+    mcp.tools["am_angr_cfg"](timeout=1)
+    assert project.analyses.calls == 2
+
+
+def test_symbolic_cfg_timeout_works_off_main_thread():
+    release = threading.Event()
+
+    class BlockingAnalyses:
+        @staticmethod
+        def CFGFast(normalize: bool = True) -> FakeCfg:  # noqa: N802
+            release.wait(timeout=5)
+            return FakeCfg()
+
+    project = FakeProject()
+    project.analyses = BlockingAnalyses()
+    mcp, state = _register_all_tools()
+    state.set_project(project)
+    outcome: dict[str, Any] = {}
+
+    def _call() -> None:
+        try:
+            mcp.tools["am_angr_cfg"](timeout=1)
+        except Exception as exc:  # noqa: BLE001
+            outcome["error"] = exc
+
+    caller = threading.Thread(target=_call)
+    caller.start()
+    caller.join(timeout=5)
+    release.set()
+    assert isinstance(outcome.get("error"), TimeoutError)
+
+
+def test_symbolic_cfg_retry_joins_in_flight_analysis():
+    release = threading.Event()
+    calls = []
+
+    class BlockingAnalyses:
+        @staticmethod
+        def CFGFast(normalize: bool = True) -> FakeCfg:  # noqa: N802
+            calls.append(normalize)
+            release.wait(timeout=5)
+            return FakeCfg()
+
+    project = FakeProject()
+    project.analyses = BlockingAnalyses()
+    mcp, state = _register_all_tools()
+    state.set_project(project)
+
+    with pytest.raises(TimeoutError, match="still running"):
+        mcp.tools["am_angr_cfg"](timeout=1)
+    with pytest.raises(TimeoutError, match="still running"):
+        mcp.tools["am_angr_cfg"](timeout=1)
+    release.set()
+    result = mcp.tools["am_angr_cfg"](timeout=5)
+
+    assert calls == [True]
+    assert result["nodes"]
+
+
+def test_symbolic_cfg_rebind_keeps_in_flight_analysis():
+    release = threading.Event()
+    calls = []
+
+    class BlockingAnalyses:
+        @staticmethod
+        def CFGFast(normalize: bool = True) -> FakeCfg:  # noqa: N802
+            calls.append(normalize)
+            release.wait(timeout=5)
+            return FakeCfg()
+
+    project = FakeProject()
+    project.analyses = BlockingAnalyses()
+    mcp, state = _register_all_tools()
+    state.set_project(project)
+
+    with pytest.raises(TimeoutError, match="still running"):
+        mcp.tools["am_angr_cfg"](timeout=1)
+    state.set_project(project)
+    release.set()
+    assert mcp.tools["am_angr_cfg"](timeout=5)["nodes"]
+    assert mcp.tools["am_angr_cfg"](timeout=5)["nodes"]
+    assert calls == [True]
+
+
+def test_symbolic_cfg_analysis_timeout_error_is_not_still_running():
+    calls = []
+
+    class FailingAnalyses:
+        @staticmethod
+        def CFGFast(normalize: bool = True) -> FakeCfg:  # noqa: N802
+            calls.append(normalize)
+            raise TimeoutError("solver gave up")
+
+    project = FakeProject()
+    project.analyses = FailingAnalyses()
+    mcp, state = _register_all_tools()
+    state.set_project(project)
+
+    for _ in range(2):
+        with pytest.raises(TimeoutError, match="solver gave up"):
+            mcp.tools["am_angr_cfg"](timeout=5)
+    assert calls == [True, True]
+
+
+def test_batch_exports_share_one_snapshot(monkeypatch):
+    calls = []
+    original = automation._function_rows
+    monkeypatch.setattr(automation, "_function_rows", lambda project: calls.append(project) or original(project))
+    mcp, _ = _register_all_tools()
+    batch = mcp.tools["am_run_batch"]([{"type": "sync_export"}, {"type": "current_program"}, {"type": "sync_export"}])
+    assert batch["failed"] == 0
+    assert len(calls) == 1
+    assert batch["results"][0]["result"] == batch["results"][2]["result"]
+
+
+def test_batch_pools_only_file_exports(monkeypatch, tmp_path):
+    pools = []
+    original = automation.ThreadPoolExecutor
+    monkeypatch.setattr(automation, "ThreadPoolExecutor", lambda **kwargs: pools.append(kwargs) or original(**kwargs))
+    mcp, _ = _register_all_tools()
+    inline = mcp.tools["am_run_batch"]([{"type": "sync_export"}, {"type": "current_program"}, {"type": "sync_export"}])
+    assert inline["failed"] == 0
+    assert pools == []
+
+    paths = [str(tmp_path / "a.json"), str(tmp_path / "b.json")]
+    batch = mcp.tools["am_run_batch"](
+        [
+            {"type": "sync_export", "output_path": paths[0]},
+            {"type": "current_program"},
+            {"type": "sync_export", "output_path": paths[1]},
+        ]
+    )
+    assert batch["failed"] == 0
+    assert pools == [{"max_workers": 2}]
+    assert [entry["result"].get("output_path") for entry in batch["results"]] == [paths[0], None, paths[1]]
+    assert all((tmp_path / name).exists() for name in ("a.json", "b.json"))
+
+
+def test_list_functions_columnar():
+    mcp, _ = _register_all_tools()
+    rows = mcp.tools["am_list_functions"](offset=0, limit=10)
+    columnar = mcp.tools["am_list_functions"](offset=0, limit=10, columnar=True)
+    assert columnar["total"] == rows["total"]
+    assert columnar["columns"]["address"] == [row["address"] for row in rows["functions"]]
+    assert columnar["columns"]["size"] == [32, 16]
+
+
+def test_xrefs_total_only_when_requested():
+    mcp, _ = _register_all_tools()
+    page = mcp.tools["am_get_xrefs_to"]("0x401000", offset=0, limit=10)
+    assert page["total"] is None
+    assert page["xrefs"] == [{"src": "0x401020", "dst": "0x401000", "type": "CodeRef"}]
+    assert mcp.tools["am_get_xrefs_to"]("0x401000", offset=1, include_total=True) == {
+        "xrefs": [],
+        "total": 1,
+        "offset": 1,
+        "limit": 100,
+    }
+
+
+def test_xrefs_total_tracks_kb_changes():
+    mcp, state = _register_all_tools()
+    xrefs = state.require_project().kb.xrefs
+    assert mcp.tools["am_get_xrefs_to"]("0x401000", include_total=True)["total"] == 1
+    original = xrefs.get_xrefs_by_dst
+    xrefs.get_xrefs_by_dst = lambda dst: [*original(dst), FakeXRef(0x401040, dst, "CodeRef")]
+    result = mcp.tools["am_get_xrefs_to"]("0x401000", include_total=True)
+    assert len(result["xrefs"]) == 2
+    assert result["total"] == 2